@@ -7,47 +7,48 @@ Usage:
 from __future__ import annotations
 
 import argparse
+from functools import lru_cache
 
 
 FONT = {
-    "A": ["  #  ", " # # ", "#####", "#   #", "#   #"],
-    "B": ["#### ", "#   #", "#### ", "#   #", "#### "],
-    "C": [" ####", "#    ", "#    ", "#    ", " ####"],
-    "D": ["#### ", "#   #", "#   #", "#   #", "#### "],
-    "E": ["#####", "#    ", "#### ", "#    ", "#####"],
-    "F": ["#####", "#    ", "#### ", "#    ", "#    "],
-    "G": [" ####", "#    ", "#  ##", "#   #", " ####"],
-    "H": ["#   #", "#   #", "#####", "#   #", "#   #"],
-    "I": ["#####", "  #  ", "  #  ", "  #  ", "#####"],
-    "J": ["  ###", "   # ", "   # ", "#  # ", " ##  "],
-    "K": ["#   #", "#  # ", "###  ", "#  # ", "#   #"],
-    "L": ["#    ", "#    ", "#    ", "#    ", "#####"],
-    "M": ["#   #", "## ##", "# # #", "#   #", "#   #"],
-    "N": ["#   #", "##  #", "# # #", "#  ##", "#   #"],
-    "O": [" ### ", "#   #", "#   #", "#   #", " ### "],
-    "P": ["#### ", "#   #", "#### ", "#    ", "#    "],
-    "Q": [" ### ", "#   #", "# # #", "#  ##", " ####"],
-    "R": ["#### ", "#   #", "#### ", "#  # ", "#   #"],
-    "S": [" ####", "#    ", " ### ", "    #", "#### "],
-    "T": ["#####", "  #  ", "  #  ", "  #  ", "  #  "],
-    "U": ["#   #", "#   #", "#   #", "#   #", " ### "],
-    "V": ["#   #", "#   #", "#   #", " # # ", "  #  "],
-    "W": ["#   #", "#   #", "# # #", "## ##", "#   #"],
-    "X": ["#   #", " # # ", "  #  ", " # # ", "#   #"],
-    "Y": ["#   #", " # # ", "  #  ", "  #  ", "  #  "],
-    "Z": ["#####", "   # ", "  #  ", " #   ", "#####"],
-    "0": [" ### ", "#  ##", "# # #", "##  #", " ### "],
-    "1": ["  #  ", " ##  ", "  #  ", "  #  ", " ### "],
-    "2": [" ### ", "#   #", "   # ", "  #  ", "#####"],
-    "3": ["#### ", "    #", " ### ", "    #", "#### "],
-    "4": ["#   #", "#   #", "#####", "    #", "    #"],
-    "5": ["#####", "#    ", "#### ", "    #", "#### "],
-    "6": [" ### ", "#    ", "#### ", "#   #", " ### "],
-    "7": ["#####", "    #", "   # ", "  #  ", "  #  "],
-    "8": [" ### ", "#   #", " ### ", "#   #", " ### "],
-    "9": [" ### ", "#   #", " ####", "    #", " ### "],
-    "-": ["     ", "     ", "#####", "     ", "     "],
-    " ": ["     ", "     ", "     ", "     ", "     "],
+    "A": ("  #  ", " # # ", "#####", "#   #", "#   #"),
+    "B": ("#### ", "#   #", "#### ", "#   #", "#### "),
+    "C": (" ####", "#    ", "#    ", "#    ", " ####"),
+    "D": ("#### ", "#   #", "#   #", "#   #", "#### "),
+    "E": ("#####", "#    ", "#### ", "#    ", "#####"),
+    "F": ("#####", "#    ", "#### ", "#    ", "#    "),
+    "G": (" ####", "#    ", "#  ##", "#   #", " ####"),
+    "H": ("#   #", "#   #", "#####", "#   #", "#   #"),
+    "I": ("#####", "  #  ", "  #  ", "  #  ", "#####"),
+    "J": ("  ###", "   # ", "   # ", "#  # ", " ##  "),
+    "K": ("#   #", "#  # ", "###  ", "#  # ", "#   #"),
+    "L": ("#    ", "#    ", "#    ", "#    ", "#####"),
+    "M": ("#   #", "## ##", "# # #", "#   #", "#   #"),
+    "N": ("#   #", "##  #", "# # #", "#  ##", "#   #"),
+    "O": (" ### ", "#   #", "#   #", "#   #", " ### "),
+    "P": ("#### ", "#   #", "#### ", "#    ", "#    "),
+    "Q": (" ### ", "#   #", "# # #", "#  ##", " ####"),
+    "R": ("#### ", "#   #", "#### ", "#  # ", "#   #"),
+    "S": (" ####", "#    ", " ### ", "    #", "#### "),
+    "T": ("#####", "  #  ", "  #  ", "  #  ", "  #  "),
+    "U": ("#   #", "#   #", "#   #", "#   #", " ### "),
+    "V": ("#   #", "#   #", "#   #", " # # ", "  #  "),
+    "W": ("#   #", "#   #", "# # #", "## ##", "#   #"),
+    "X": ("#   #", " # # ", "  #  ", " # # ", "#   #"),
+    "Y": ("#   #", " # # ", "  #  ", "  #  ", "  #  "),
+    "Z": ("#####", "   # ", "  #  ", " #   ", "#####"),
+    "0": (" ### ", "#  ##", "# # #", "##  #", " ### "),
+    "1": ("  #  ", " ##  ", "  #  ", "  #  ", " ### "),
+    "2": (" ### ", "#   #", "   # ", "  #  ", "#####"),
+    "3": ("#### ", "    #", " ### ", "    #", "#### "),
+    "4": ("#   #", "#   #", "#####", "    #", "    #"),
+    "5": ("#####", "#    ", "#### ", "    #", "#### "),
+    "6": (" ### ", "#    ", "#### ", "#   #", " ### "),
+    "7": ("#####", "    #", "   # ", "  #  ", "  #  "),
+    "8": (" ### ", "#   #", " ### ", "#   #", " ### "),
+    "9": (" ### ", "#   #", " ####", "    #", " ### "),
+    "-": ("     ", "     ", "#####", "     ", "     "),
+    " ": ("     ", "     ", "     ", "     ", "     "),
 }
 
 
@@ -61,14 +62,17 @@ def scale_rows(rows: list[str], scale: int) -> list[str]:
     return scaled
 
 
+@lru_cache(maxsize=None)
+def _scaled_glyph(ch: str, scale: int) -> tuple[str, ...]:
+    glyph = FONT.get(ch, FONT["-"])
+    return tuple(scale_rows([f"{row}  " for row in glyph], scale))
+
+
 def render_text(text: str, scale: int = 1) -> str:
-    chars = [FONT.get(ch, FONT["-"]) for ch in text.upper()]
-    rows = ["" for _ in range(5)]
-    for glyph in chars:
-        for idx, row in enumerate(glyph):
-            rows[idx] += f"{row}  "
-    rows = scale_rows(rows, scale)
-    return "\n".join(rows)
+    glyphs = [_scaled_glyph(ch, scale) for ch in text.upper()]
+    return "\n".join(
+        "".join(glyph[idx] for glyph in glyphs) for idx in range(5 * scale)
+    )
 
 
 def main() -> None:
@@ -9,7 +9,9 @@ from __future__ import annotations
 import argparse
 import ast
 import math
-from typing import Any
+import operator
+from functools import lru_cache
+from typing import Any, Callable
 
 
 ALLOWED_NAMES = {
@@ -32,54 +34,116 @@ ALLOWED_NAMES = {
 }
 
 
-def _eval_node(node: ast.AST) -> Any:
-    if isinstance(node, ast.Expression):
-        return _eval_node(node.body)
-    if isinstance(node, ast.Constant):
-        if isinstance(node.value, (int, float)):
-            return node.value
-        raise ValueError("Only numbers are allowed")
-    if isinstance(node, ast.BinOp):
-        left = _eval_node(node.left)
-        right = _eval_node(node.right)
-        if isinstance(node.op, ast.Add):
-            return left + right
-        if isinstance(node.op, ast.Sub):
-            return left - right
-        if isinstance(node.op, ast.Mult):
-            return left * right
-        if isinstance(node.op, ast.Div):
-            return left / right
-        if isinstance(node.op, ast.Pow):
-            return left**right
-        if isinstance(node.op, ast.Mod):
-            return left % right
+_BINOPS: dict[type[ast.operator], Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Pow: operator.pow,
+    ast.Mod: operator.mod,
+}
+
+_UNOPS: dict[type[ast.unaryop], Callable[[Any], Any]] = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+
+def _eval_expression(node: ast.Expression) -> Any:
+    return _eval_node(node.body)
+
+
+def _eval_constant(node: ast.Constant) -> Any:
+    if isinstance(node.value, (int, float)):
+        return node.value
+    raise ValueError("Only numbers are allowed")
+
+
+def _eval_binop(node: ast.BinOp) -> Any:
+    left = _eval_node(node.left)
+    right = _eval_node(node.right)
+    op = _BINOPS.get(type(node.op))
+    if op is None:
         raise ValueError("Unsupported operator")
-    if isinstance(node, ast.UnaryOp):
-        value = _eval_node(node.operand)
-        if isinstance(node.op, ast.UAdd):
-            return +value
-        if isinstance(node.op, ast.USub):
-            return -value
+    return op(left, right)
+
+
+def _eval_unaryop(node: ast.UnaryOp) -> Any:
+    value = _eval_node(node.operand)
+    op = _UNOPS.get(type(node.op))
+    if op is None:
         raise ValueError("Unsupported unary operator")
-    if isinstance(node, ast.Name):
-        if node.id in ALLOWED_NAMES:
-            return ALLOWED_NAMES[node.id]
-        raise ValueError(f"Unknown symbol: {node.id}")
-    if isinstance(node, ast.Call):
-        if not isinstance(node.func, ast.Name):
-            raise ValueError("Only simple functions allowed")
-        func = ALLOWED_NAMES.get(node.func.id)
-        if func is None:
-            raise ValueError(f"Unknown function: {node.func.id}")
-        args = [_eval_node(arg) for arg in node.args]
-        return func(*args)
-    raise ValueError("Unsupported expression")
+    return op(value)
+
+
+def _eval_name(node: ast.Name) -> Any:
+    if node.id in ALLOWED_NAMES:
+        return ALLOWED_NAMES[node.id]
+    raise ValueError(f"Unknown symbol: {node.id}")
+
+
+class _BoundCall(ast.AST):
+    """Call whose function name was resolved against ALLOWED_NAMES."""
+
+    _fields = ("func", "args")
+
+
+class _ResolveNames(ast.NodeTransformer):
+    """Replace allowed constants and called functions with their values."""
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        value = ALLOWED_NAMES.get(node.id)
+        if isinstance(value, (int, float)):
+            return ast.copy_location(ast.Constant(value=value), node)
+        return node
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        node.args = [self.visit(arg) for arg in node.args]
+        if isinstance(node.func, ast.Name) and node.func.id in ALLOWED_NAMES:
+            bound = _BoundCall(func=ALLOWED_NAMES[node.func.id], args=node.args)
+            return ast.copy_location(bound, node)
+        return node
+
+
+def _eval_bound_call(node: _BoundCall) -> Any:
+    return node.func(*[_eval_node(arg) for arg in node.args])
+
+
+def _eval_call(node: ast.Call) -> Any:
+    if not isinstance(node.func, ast.Name):
+        raise ValueError("Only simple functions allowed")
+    func = ALLOWED_NAMES.get(node.func.id)
+    if func is None:
+        raise ValueError(f"Unknown function: {node.func.id}")
+    args = [_eval_node(arg) for arg in node.args]
+    return func(*args)
+
+
+_NODES: dict[type[ast.AST], Callable[[Any], Any]] = {
+    ast.Expression: _eval_expression,
+    ast.Constant: _eval_constant,
+    ast.BinOp: _eval_binop,
+    ast.UnaryOp: _eval_unaryop,
+    ast.Name: _eval_name,
+    ast.Call: _eval_call,
+    _BoundCall: _eval_bound_call,
+}
+
+
+def _eval_node(node: ast.AST) -> Any:
+    handler = _NODES.get(type(node))
+    if handler is None:
+        raise ValueError("Unsupported expression")
+    return handler(node)
+
+
+@lru_cache(maxsize=256)
+def _parse(expr: str) -> ast.AST:
+    return _ResolveNames().visit(ast.parse(expr, mode="eval"))
 
 
 def safe_eval(expr: str) -> float:
-    tree = ast.parse(expr, mode="eval")
-    return float(_eval_node(tree))
+    return float(_eval_node(_parse(expr)))
 
 
 def repl() -> None:
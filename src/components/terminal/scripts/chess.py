@@ -1,25 +1,201 @@
-"""Minimal chess (basic legal moves, no castling/en passant)."""
+"""Minimal chess (basic legal moves, no castling/en passant).
 
-from __future__ import annotations
+The board is a dict of twelve bitboards, one per piece letter, with bit
+``y * 8 + x`` set for every square holding that piece.
+"""
 
-from itertools import product
+from __future__ import annotations
 
 
 FILES = "abcdefgh"
 RANKS = "12345678"
+WHITE_PIECES = "PNBRQK"
+BLACK_PIECES = "pnbrqk"
+START_POSITION = (
+	"rnbqkbnr"
+	"pppppppp"
+	"........"
+	"........"
+	"........"
+	"........"
+	"PPPPPPPP"
+	"RNBQKBNR"
+)
+
+MASK64 = (1 << 64) - 1
+
+Board = dict[str, int]
+
+
+def in_bounds(x: int, y: int) -> bool:
+	return 0 <= x < 8 and 0 <= y < 8
+
+
+def _leaper_table(offsets: tuple[tuple[int, int], ...]) -> tuple[int, ...]:
+	table = []
+	for sq in range(64):
+		x, y = sq % 8, sq // 8
+		mask = 0
+		for dx, dy in offsets:
+			if in_bounds(x + dx, y + dy):
+				mask |= 1 << ((y + dy) * 8 + x + dx)
+		table.append(mask)
+	return tuple(table)
+
+
+def _ray_table(dx: int, dy: int) -> tuple[int, ...]:
+	table = []
+	for sq in range(64):
+		x, y = sq % 8 + dx, sq // 8 + dy
+		mask = 0
+		while in_bounds(x, y):
+			mask |= 1 << (y * 8 + x)
+			x += dx
+			y += dy
+		table.append(mask)
+	return tuple(table)
+
+
+SQUARE_COORDS = tuple((sq % 8, sq // 8) for sq in range(64))
+KNIGHT_ATTACKS = _leaper_table(
+	((1, 2), (2, 1), (-1, 2), (-2, 1), (1, -2), (2, -1), (-1, -2), (-2, -1))
+)
+KING_ATTACKS = _leaper_table(
+	((1, 1), (1, 0), (1, -1), (0, 1), (0, -1), (-1, 1), (-1, 0), (-1, -1))
+)
+PAWN_ATTACKS = {
+	"w": _leaper_table(((-1, -1), (1, -1))),
+	"b": _leaper_table(((-1, 1), (1, 1))),
+}
+# Rays that walk towards higher square indices stop at their lowest set
+# blocker bit, the others at their highest.
+POSITIVE_RAYS = {
+	"b": (_ray_table(1, 1), _ray_table(-1, 1)),
+	"r": (_ray_table(1, 0), _ray_table(0, 1)),
+}
+NEGATIVE_RAYS = {
+	"b": (_ray_table(1, -1), _ray_table(-1, -1)),
+	"r": (_ray_table(-1, 0), _ray_table(0, -1)),
+}
+
+
+# Fixed-shift magic multipliers for this board's square numbering. Each
+# table has exactly one slot per occupancy subset, the same size a PEXT
+# index would give; PEXT itself is not reachable from Pyodide's wasm build.
+ROOK_MAGICS = (
+	0x2080001440022581, 0x1080200040001080, 0x4080100008200080,
+	0x0280080080100254, 0x4D8004000A180080, 0x0100080400020100,
+	0x1080010040800200, 0x0200004402002081, 0x0068800024884004,
+	0x1000804000802002, 0x000200208A001040, 0x3008801000800800,
+	0x2006001060440A00, 0x1000800200800400, 0x0004000441024810,
+	0xA001000082004100, 0x0040808000204014, 0x0000424002201000,
+	0x0010110041002000, 0x0000090021041000, 0x0204008004800800,
+	0x0000808004000200, 0x6006040021485042, 0x0000020002409924,
+	0x2000401980028020, 0x4000400100308100, 0x0000820200201041,
+	0xB100100080800800, 0x3004080080040080, 0x0802000200041009,
+	0x01A0580400021110, 0x00020042000408A1, 0x4218884000800023,
+	0x0480201000400045, 0x0010200080801000, 0x1200200901001000,
+	0x0000100801000500, 0x0080020080800400, 0x004A000100404080,
+	0x0480005402001081, 0x258000402000C000, 0xA010004820084002,
+	0x0480200010008080, 0x244100100021000C, 0x2040080005010010,
+	0x0012000810020004, 0x0011000200B9000C, 0x1121000080410002,
+	0x00082080410A0600, 0x4002008100402600, 0x0A0300E008544100,
+	0x7B00080010008080, 0x0300080100100500, 0x0002020080040080,
+	0x0042521810214400, 0x8A00004089140200, 0x00001280010A2041,
+	0x0400401102042086, 0x41902000100C4101, 0x0043020420900009,
+	0x00E2000410082002, 0x4402000108041002, 0x2100101A00814804,
+	0x0400010400218246,
+)
+BISHOP_MAGICS = (
+	0x0102040418220020, 0x0108024802002028, 0x8010044040400001,
+	0x0022209200044800, 0x4004504005040114, 0x0022010420A80800,
+	0x0008441008090002, 0x0000420801480200, 0x1100220244011C00,
+	0x00883004081AB020, 0x4400100152002000, 0x4019080841004000,
+	0x2861021210000000, 0x400EA10108400020, 0x4800208208A24000,
+	0x0020A500A0842085, 0x3410000802504400, 0x0010E0200C010060,
+	0x0014182042408200, 0x4094006840112109, 0x2014200202010000,
+	0x000100020080C400, 0x800400420D2C0200, 0x0002200182251000,
+	0x0010F10304C41000, 0x001024A008281084, 0x0088110002040100,
+	0x0820080001004008, 0x0104040020410050, 0x0110002027040500,
+	0x418C008009182100, 0x2C00A9040C80480B, 0x008110C8005020A4,
+	0x4004210802041000, 0x0004020108208100, 0x0000080800120A00,
+	0x430C008400820102, 0x1400808100020108, 0x005006020010A8A0,
+	0x000801868004A220, 0x00420105C00C2000, 0x1010921032019040,
+	0x0300222028103000, 0x0008004208001080, 0x5410202248811400,
+	0x0008010800800808, 0x3C02C20404000900, 0x0408022282040032,
+	0x0000941002100000, 0x0112209A10100804, 0x080C020111210000,
+	0x442002A442022008, 0x00084A181B040000, 0x00115021021C2080,
+	0x4010051000A20000, 0x0404688085060000, 0x0000220110011000,
+	0x140000220734200C, 0x0440010424020800, 0x2204828883460800,
+	0x0020000004050410, 0x4060004A20082080, 0x00489034B002C201,
+	0x0444049010410300,
+)
+
+
+def slider_attacks(kind: str, sq: int, occ: int) -> int:
+	attacks = 0
+	for rays in POSITIVE_RAYS[kind]:
+		ray = rays[sq]
+		blockers = ray & occ
+		if blockers:
+			ray ^= rays[(blockers & -blockers).bit_length() - 1]
+		attacks |= ray
+	for rays in NEGATIVE_RAYS[kind]:
+		ray = rays[sq]
+		blockers = ray & occ
+		if blockers:
+			ray ^= rays[blockers.bit_length() - 1]
+		attacks |= ray
+	return attacks
+
+
+def _magic_tables(
+	kind: str, magics: tuple[int, ...]
+) -> tuple[tuple[int, ...], tuple[int, ...], tuple[list[int], ...]]:
+	masks, shifts, tables = [], [], []
+	for sq in range(64):
+		# The last square of a ray never shadows anything, so it is left out.
+		mask = 0
+		for rays in POSITIVE_RAYS[kind]:
+			ray = rays[sq]
+			mask |= ray & ~(1 << ray.bit_length() >> 1)
+		for rays in NEGATIVE_RAYS[kind]:
+			ray = rays[sq]
+			mask |= ray & (ray - 1)
+		shift = 64 - bin(mask).count("1")
+		table = [0] * (1 << (64 - shift))
+		occ = 0
+		while True:
+			table[(occ * magics[sq] & MASK64) >> shift] = slider_attacks(kind, sq, occ)
+			occ = (occ - mask) & mask
+			if not occ:
+				break
+		masks.append(mask)
+		shifts.append(shift)
+		tables.append(table)
+	return tuple(masks), tuple(shifts), tuple(tables)
+
+
+ROOK_MASKS, ROOK_SHIFTS, ROOK_ATTACKS = _magic_tables("r", ROOK_MAGICS)
+BISHOP_MASKS, BISHOP_SHIFTS, BISHOP_ATTACKS = _magic_tables("b", BISHOP_MAGICS)
+
+
+def rook_attacks(sq: int, occ: int) -> int:
+	index = (occ & ROOK_MASKS[sq]) * ROOK_MAGICS[sq] & MASK64
+	return ROOK_ATTACKS[sq][index >> ROOK_SHIFTS[sq]]
 
 
-def new_board() -> list[list[str]]:
-	return [
-		list("rnbqkbnr"),
-		list("pppppppp"),
-		list("........"),
-		list("........"),
-		list("........"),
-		list("........"),
-		list("PPPPPPPP"),
-		list("RNBQKBNR"),
-	]
+def bishop_attacks(sq: int, occ: int) -> int:
+	index = (occ & BISHOP_MASKS[sq]) * BISHOP_MAGICS[sq] & MASK64
+	return BISHOP_ATTACKS[sq][index >> BISHOP_SHIFTS[sq]]
+
+
+def new_board() -> Board:
+	board = dict.fromkeys(WHITE_PIECES + BLACK_PIECES, 0)
+	for sq, piece in enumerate(START_POSITION):
+		if piece != ".":
+			board[piece] |= 1 << sq
+	return board
 
 
 def color(piece: str) -> str | None:
@@ -28,99 +204,91 @@ def color(piece: str) -> str | None:
 	return "w" if piece.isupper() else "b"
 
 
-def in_bounds(x: int, y: int) -> bool:
-	return 0 <= x < 8 and 0 <= y < 8
+def occupancy(board: Board, side: str | None = None) -> int:
+	pieces = board if side is None else WHITE_PIECES if side == "w" else BLACK_PIECES
+	occ = 0
+	for piece in pieces:
+		occ |= board[piece]
+	return occ
 
 
-def moves_for(board: list[list[str]], x: int, y: int) -> list[tuple[int, int]]:
-	piece = board[y][x]
-	c = color(piece)
-	if not c:
-		return []
-	res: list[tuple[int, int]] = []
+def piece_at(board: Board, sq: int) -> str:
+	mask = 1 << sq
+	for piece, bb in board.items():
+		if bb & mask:
+			return piece
+	return "."
 
-	def add(nx: int, ny: int) -> bool:
-		if not in_bounds(nx, ny):
-			return False
-		target = board[ny][nx]
-		if target != "." and color(target) == c:
-			return False
-		res.append((nx, ny))
-		return target == "."
-
-	def ray(dx: int, dy: int) -> None:
-		nx, ny = x + dx, y + dy
-		while in_bounds(nx, ny):
-			target = board[ny][nx]
-			if target != "." and color(target) == c:
-				break
-			res.append((nx, ny))
-			if target != ".":
-				break
-			nx += dx
-			ny += dy
 
+def attacks_from(piece: str, sq: int, occ: int) -> int:
 	p = piece.lower()
 	if p == "p":
-		direction = -1 if c == "w" else 1
-		start_row = 6 if c == "w" else 1
-		one = y + direction
-		if in_bounds(x, one) and board[one][x] == ".":
-			res.append((x, one))
-			two = y + 2 * direction
-			if y == start_row and board[two][x] == ".":
-				res.append((x, two))
-		for dx in (-1, 1):
-			nx, ny = x + dx, y + direction
-			if in_bounds(nx, ny) and board[ny][nx] != "." and color(board[ny][nx]) != c:
-				res.append((nx, ny))
-		return res
+		return PAWN_ATTACKS[color(piece)][sq]
 	if p == "n":
-		for dx, dy in [
-			(1, 2),
-			(2, 1),
-			(-1, 2),
-			(-2, 1),
-			(1, -2),
-			(2, -1),
-			(-1, -2),
-			(-2, -1),
-		]:
-			add(x + dx, y + dy)
-		return res
-	if p in {"b", "q"}:
-		ray(1, 1)
-		ray(1, -1)
-		ray(-1, 1)
-		ray(-1, -1)
-	if p in {"r", "q"}:
-		ray(1, 0)
-		ray(-1, 0)
-		ray(0, 1)
-		ray(0, -1)
+		return KNIGHT_ATTACKS[sq]
 	if p == "k":
-		for dx in (-1, 0, 1):
-			for dy in (-1, 0, 1):
-				if dx == 0 and dy == 0:
-					continue
-				add(x + dx, y + dy)
+		return KING_ATTACKS[sq]
+	if p == "b":
+		return bishop_attacks(sq, occ)
+	if p == "r":
+		return rook_attacks(sq, occ)
+	return bishop_attacks(sq, occ) | rook_attacks(sq, occ)
+
+
+def squares(bb: int) -> list[tuple[int, int]]:
+	res: list[tuple[int, int]] = []
+	while bb:
+		res.append(SQUARE_COORDS[(bb & -bb).bit_length() - 1])
+		bb &= bb - 1
 	return res
 
 
-def is_in_check(board: list[list[str]], side: str) -> bool:
-	king = "K" if side == "w" else "k"
-	king_pos = None
-	for y, x in product(range(8), range(8)):
-		if board[y][x] == king:
-			king_pos = (x, y)
-			break
-	if not king_pos:
-		return False
-	for y, x in product(range(8), range(8)):
-		piece_color = color(board[y][x])
-		if piece_color and piece_color != side and king_pos in moves_for(board, x, y):
-			return True
-	return False
+def pawn_targets(sq: int, side: str, own: int, occ: int) -> int:
+	step = -8 if side == "w" else 8
+	start_row = 6 if side == "w" else 1
+	targets = PAWN_ATTACKS[side][sq] & occ & ~own
+	one = sq + step
+	if 0 <= one < 64 and not occ >> one & 1:
+		targets |= 1 << one
+		two = one + step
+		if sq // 8 == start_row and not occ >> two & 1:
+			targets |= 1 << two
+	return targets
+
+
+def moves_for(board: Board, x: int, y: int) -> list[tuple[int, int]]:
+	sq = y * 8 + x
+	piece = piece_at(board, sq)
+	c = color(piece)
+	if not c:
+		return []
+	own = occupancy(board, c)
+	occ = own | occupancy(board, "b" if c == "w" else "w")
+	if piece.lower() == "p":
+		return squares(pawn_targets(sq, c, own, occ))
+	return squares(attacks_from(piece, sq, occ) & ~own)
+
+
+def square_attacked(board: Board, sq: int, by_side: str) -> bool:
+	# Attacks are symmetric, so look outwards from sq with each piece type
+	# and see whether it lands on an enemy piece of that type.
+	pawn, knight, bishop, rook, queen, king = (
+		WHITE_PIECES if by_side == "w" else BLACK_PIECES
+	)
+	if KNIGHT_ATTACKS[sq] & board[knight] or KING_ATTACKS[sq] & board[king]:
+		return True
+	if PAWN_ATTACKS["b" if by_side == "w" else "w"][sq] & board[pawn]:
+		return True
+	occ = occupancy(board)
+	diagonal = board[bishop] | board[queen]
+	if diagonal and bishop_attacks(sq, occ) & diagonal:
+		return True
+	straight = board[rook] | board[queen]
+	return bool(straight and rook_attacks(sq, occ) & straight)
+
+
+def is_in_check(board: Board, side: str, king_sq: int) -> bool:
+	return square_attacked(board, king_sq, "b" if side == "w" else "w")
 
 
 def parse_move(move: str) -> tuple[int, int, int, int] | None:
@@ -133,15 +301,22 @@ def parse_move(move: str) -> tuple[int, int, int, int] | None:
 	return FILES.index(fx), 8 - int(fy), FILES.index(tx), 8 - int(ty)
 
 
-def print_board(board: list[list[str]]) -> None:
+def print_board(board: Board) -> None:
+	cells = bytearray(b"." * 64)
+	for piece, bb in board.items():
+		code = ord(piece)
+		while bb:
+			cells[(bb & -bb).bit_length() - 1] = code
+			bb &= bb - 1
 	print("  a b c d e f g h")
-	for y, row in enumerate(board):
-		print(f"{8 - y} " + " ".join(row))
+	for y in range(8):
+		print(f"{8 - y} " + " ".join(cells[y * 8 : y * 8 + 8].decode()))
 	print()
 
 
 def main() -> None:
 	board = new_board()
+	king_sq = {"w": 60, "b": 4}
 	turn = "w"
 	while True:
 		print_board(board)
@@ -154,7 +329,7 @@ def main() -> None:
 			print("Invalid move format.")
 			continue
 		fx, fy, tx, ty = parsed
-		piece = board[fy][fx]
+		piece = piece_at(board, fy * 8 + fx)
 		if piece == "." or color(piece) != turn:
 			print("No piece to move.")
 			continue
@@ -162,15 +337,26 @@ def main() -> None:
 		if (tx, ty) not in legal:
 			print("Illegal move.")
 			continue
-		clone = [row[:] for row in board]
-		clone[ty][tx] = piece
-		clone[fy][fx] = "."
+		to = ty * 8 + tx
+		src = 1 << (fy * 8 + fx)
+		dst = 1 << to
+		target = piece_at(board, to)
+		placed = piece
 		if piece.lower() == "p" and ty in {0, 7}:
-			clone[ty][tx] = "Q" if turn == "w" else "q"
-		if is_in_check(clone, turn):
+			placed = "Q" if turn == "w" else "q"
+		if target != ".":
+			board[target] ^= dst
+		board[piece] ^= src
+		board[placed] |= dst
+		king = to if piece.lower() == "k" else king_sq[turn]
+		if is_in_check(board, turn, king):
+			board[placed] ^= dst
+			board[piece] |= src
+			if target != ".":
+				board[target] |= dst
 			print("Move leaves king in check.")
 			continue
-		board = clone
+		king_sq[turn] = king
 		turn = "b" if turn == "w" else "w"
 
 
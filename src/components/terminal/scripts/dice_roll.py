@@ -11,6 +11,21 @@ import random
 from collections import Counter
 
 
+VECTOR_THRESHOLD = 1000
+
+
+def roll_vectorized(
+	sides: int, count: int, seed: int | None
+) -> tuple[list[int], list[int]] | None:
+	try:
+		import numpy as np
+	except ImportError:  # pragma: no cover - numpy is optional
+		return None
+	rolls = np.random.default_rng(seed).integers(1, sides + 1, size=count)
+	histogram = np.bincount(rolls, minlength=sides + 1)
+	return rolls.tolist(), histogram.tolist()
+
+
 def main() -> None:
 	parser = argparse.ArgumentParser(description="Dice roller")
 	parser.add_argument("--sides", type=int, default=6, help="Sides per die")
@@ -20,18 +35,23 @@ def main() -> None:
 
 	sides = max(2, args.sides)
 	count = max(1, args.count)
-	if args.seed is not None:
-		random.seed(args.seed)
-
-	rolls = [random.randint(1, sides) for _ in range(count)]
+	vectorized = None
+	if count > VECTOR_THRESHOLD:
+		vectorized = roll_vectorized(sides, count, args.seed)
+	if vectorized:
+		rolls, histogram = vectorized
+	else:
+		if args.seed is not None:
+			random.seed(args.seed)
+		rolls = [random.randint(1, sides) for _ in range(count)]
+		histogram = Counter(rolls)
 	total = sum(rolls)
 	print(f"Rolls: {', '.join(map(str, rolls))}")
 	print(f"Total: {total}  Avg: {total / count:.2f}")
 
-	histogram = Counter(rolls)
 	print("Histogram:")
 	for face in range(1, sides + 1):
-		bar = "#" * histogram.get(face, 0)
+		bar = "#" * histogram[face]
 		print(f"{face:>2}: {bar}")
 
 
@@ -10,17 +10,18 @@ import random
 
 
 MEDIA = {
-	"image": ["nebula.txt", "grid.txt", "city.txt", "arcade.txt"],
-	"video": ["loop.vid", "loop2.vid", "loop3.vid", "loop4.vid", "loop5.vid"],
-	"mp3": [
+	"image": ("nebula.txt", "grid.txt", "city.txt", "arcade.txt"),
+	"video": ("loop.vid", "loop2.vid", "loop3.vid", "loop4.vid", "loop5.vid"),
+	"mp3": (
 		"synth.mp3",
 		"synth2.mp3",
 		"synth3.mp3",
 		"neon_drive.mp3",
 		"circuit_beat.mp3",
 		"glow_shift.mp3",
-	],
+	),
 }
+MEDIA_KINDS = tuple(MEDIA)
 
 
 def main() -> None:
@@ -29,7 +30,7 @@ def main() -> None:
 	args = parser.parse_args()
 
 	if args.random:
-		category = random.choice(list(MEDIA))
+		category = random.choice(MEDIA_KINDS)
 		item = random.choice(MEDIA[category])
 		print(f"Try: {category} ~/media/{item}")
 		return
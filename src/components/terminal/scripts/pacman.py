@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import argparse
 import random
 import sys
 try:
@@ -23,54 +24,46 @@ PAC = "C"
 GHOST = "G"
 
 
-def build_map(width: int, height: int) -> list[list[str]]:
-	grid = [[PELLET for _ in range(width)] for _ in range(height)]
-	for x in range(width):
-		grid[0][x] = WALL
-		grid[height - 1][x] = WALL
-	for y in range(height):
-		grid[y][0] = WALL
-		grid[y][width - 1] = WALL
-	for y, x in product(range(2, height - 2, 3), range(2, width - 2)):
-		if x % 4 == 0:
-			grid[y][x] = WALL
-	return grid
-
-
-def parse_size_arg(name: str, default: int) -> int:
-	value = default
-	args = sys.argv[1:]
-	for index, arg in enumerate(args):
-		if arg == name and index + 1 < len(args):
-			try:
-				value = int(args[index + 1])
-			except ValueError:
-				value = default
-			break
-		if arg.startswith(f"{name}="):
-			try:
-				value = int(arg.split("=", 1)[1])
-			except ValueError:
-				value = default
-			break
-	return value
+def build_map(width: int, height: int) -> tuple[list[list[str]], int, int]:
+	grid = [[PELLET] * width for _ in range(height)]
+	grid[0] = [WALL] * width
+	grid[-1] = [WALL] * width
+	for row in grid:
+		row[0] = WALL
+		row[-1] = WALL
+	for y, x in product(range(2, height - 2, 3), range(4, width - 2, 4)):
+		grid[y][x] = WALL
+	walls = pellets = 0
+	for idx, cell in enumerate(cell for row in grid for cell in row):
+		if cell == WALL:
+			walls |= 1 << idx
+		else:
+			pellets |= 1 << idx
+	return grid, walls, pellets
 
 
 def main() -> None:
-	width = max(12, parse_size_arg("--width", 20))
-	height = max(10, parse_size_arg("--height", 12))
-	grid = build_map(width, height)
+	parser = argparse.ArgumentParser(description="Pacman demo")
+	parser.add_argument("--width", type=int, default=20)
+	parser.add_argument("--height", type=int, default=12)
+	args = parser.parse_args()
+
+	width = max(12, args.width)
+	height = max(10, args.height)
+	grid, walls, pellets = build_map(width, height)
+	stride = width + 1
+	cells = bytearray("\n".join("".join(row) for row in grid), "ascii")
 
 	pac = [1, 1]
 	ghost = [width - 2, height - 2]
 	score = 0
 
 	while True:
-		display = [row[:] for row in grid]
-		display[pac[1]][pac[0]] = PAC
-		display[ghost[1]][ghost[0]] = GHOST
-		print("\n".join("".join(row) for row in display))
-		print(f"Score: {score}")
+		display = cells[:]
+		display[pac[1] * stride + pac[0]] = ord(PAC)
+		display[ghost[1] * stride + ghost[0]] = ord(GHOST)
+		sys.stdout.write(f"{display.decode()}\nScore: {score}\n")
+		sys.stdout.flush()
 		move = input("Move (WASD, Q=quit): ").strip().lower()
 		if move == "q":
 			break
@@ -85,10 +78,12 @@ def main() -> None:
 			dx = 1
 
 		nx, ny = pac[0] + dx, pac[1] + dy
-		if grid[ny][nx] != WALL:
+		bit = 1 << (ny * width + nx)
+		if not walls & bit:
 			pac = [nx, ny]
-			if grid[ny][nx] == PELLET:
-				grid[ny][nx] = EMPTY
+			if pellets & bit:
+				pellets ^= bit
+				cells[ny * stride + nx] = ord(EMPTY)
 				score += 1
 
 		gx, gy = ghost
@@ -96,14 +91,14 @@ def main() -> None:
 		random.shuffle(choices)
 		for dx, dy in choices:
 			nx, ny = gx + dx, gy + dy
-			if grid[ny][nx] != WALL:
+			if not walls >> (ny * width + nx) & 1:
 				ghost = [nx, ny]
 				break
 
 		if pac == ghost:
 			print("Caught by ghost. Game over!")
 			break
-		if all(PELLET not in row for row in grid):
+		if not pellets:
 			print("All pellets collected. You win!")
 			break
 
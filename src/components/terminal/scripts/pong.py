@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import argparse
 import random
+import sys
 
 
 def main() -> None:
@@ -20,21 +21,23 @@ def main() -> None:
 	vel = [random.choice([-1, 1]), random.choice([-1, 1])]
 	score = [0, 0]
 	lives = 3
+	stride = width + 1
+	edge = "-" * width
+	base = bytearray(
+		"\n".join([edge] + [" " * width] * (height - 2) + [edge]), "ascii"
+	)
 
 	while lives > 0:
-		board = [[" " for _ in range(width)] for _ in range(height)]
-		for x in range(width):
-			board[0][x] = "-"
-			board[height - 1][x] = "-"
-
+		board = base[:]
 		for x in range(paddle - 2, paddle + 3):
-			board[height - 2][max(1, min(width - 2, x))] = "="
+			board[(height - 2) * stride + max(1, min(width - 2, x))] = ord("=")
 		for x in range(ai_paddle - 2, ai_paddle + 3):
-			board[1][max(1, min(width - 2, x))] = "="
+			board[stride + max(1, min(width - 2, x))] = ord("=")
 
-		board[ball[1]][ball[0]] = "o"
-		print("\n".join("".join(row) for row in board))
-		print(f"Score: You {score[0]} - AI {score[1]}  Lives: {lives}")
+		board[ball[1] * stride + ball[0]] = ord("o")
+		status = f"Score: You {score[0]} - AI {score[1]}  Lives: {lives}"
+		sys.stdout.write(f"{board.decode()}\n{status}\n")
+		sys.stdout.flush()
 		move = input("Move (A/D, Q=quit): ").strip().lower()
 		if move == "q":
 			break
@@ -11,22 +11,23 @@ import random
 
 
 QUOTES = {
-    "focus": [
+    "focus": (
         "Focus beats luck.",
         "Slow is smooth, smooth is fast.",
         "One task at a time.",
-    ],
-    "build": [
+    ),
+    "build": (
         "Ship it.",
         "Small steps, big wins.",
         "Make it work, make it right, make it fast.",
-    ],
-    "retro": [
+    ),
+    "retro": (
         "Boot sequence complete.",
         "Insert disk and press any key.",
         "Pixels are forever.",
-    ],
+    ),
 }
+ALL_QUOTES = tuple(quote for items in QUOTES.values() for quote in items)
 
 
 def main() -> None:
@@ -40,15 +41,14 @@ def main() -> None:
         random.seed(args.seed)
 
     if args.category == "all":
-        pool = [quote for items in QUOTES.values() for quote in items]
+        pool = ALL_QUOTES
     else:
-        pool = QUOTES.get(args.category, [])
+        pool = QUOTES.get(args.category, ())
     if not pool:
         available = ", ".join(sorted(QUOTES))
         raise SystemExit(f"Unknown category. Available: {available}")
 
-    for _ in range(max(1, args.count)):
-        print(random.choice(pool))
+    print("\n".join(random.choices(pool, k=max(1, args.count))))
 
 
 if __name__ == "__main__":
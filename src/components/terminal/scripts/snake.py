@@ -2,59 +2,49 @@
 
 from __future__ import annotations
 
+import argparse
 import random
 import sys
+from collections import deque
 
 
-def parse_size_arg(name: str, default: int) -> int:
-	value = default
-	args = sys.argv[1:]
-	for index, arg in enumerate(args):
-		if arg == name and index + 1 < len(args):
-			try:
-				value = int(args[index + 1])
-			except ValueError:
-				value = default
-			break
-		if arg.startswith(f"{name}="):
-			try:
-				value = int(arg.split("=", 1)[1])
-			except ValueError:
-				value = default
-			break
-	return value
+def empty_board(width: int, height: int) -> bytearray:
+	wall = "#" * width
+	inner = "#" + " " * (width - 2) + "#"
+	return bytearray("\n".join([wall] + [inner] * (height - 2) + [wall]), "ascii")
 
 
-def draw(board: list[list[str]]) -> None:
-	print("\n".join("".join(row) for row in board))
+def draw(board: bytearray, status: str) -> None:
+	sys.stdout.write(f"{board.decode()}\n{status}\n")
+	sys.stdout.flush()
 
 
 def main() -> None:
-	width = max(10, parse_size_arg("--width", 16))
-	height = max(8, parse_size_arg("--height", 12))
-	snake = [(width // 2, height // 2)]
+	parser = argparse.ArgumentParser(description="Snake game")
+	parser.add_argument("--width", type=int, default=16)
+	parser.add_argument("--height", type=int, default=12)
+	args = parser.parse_args()
+
+	width = max(10, args.width)
+	height = max(8, args.height)
+	snake = deque([(width // 2, height // 2)])
+	body = set(snake)
 	direction = (1, 0)
 	food = (random.randint(1, width - 2), random.randint(1, height - 2))
 	score = 0
+	stride = width + 1
+	base = empty_board(width, height)
 
 	while True:
-		board = [[" " for _ in range(width)] for _ in range(height)]
-		for x in range(width):
-			board[0][x] = "#"
-			board[height - 1][x] = "#"
-		for y in range(height):
-			board[y][0] = "#"
-			board[y][width - 1] = "#"
-
+		board = base[:]
 		for x, y in snake:
-			board[y][x] = "o"
+			board[y * stride + x] = ord("o")
 		head_x, head_y = snake[-1]
-		board[head_y][head_x] = "@"
+		board[head_y * stride + head_x] = ord("@")
 		fx, fy = food
-		board[fy][fx] = "*"
+		board[fy * stride + fx] = ord("*")
 
-		draw(board)
-		print(f"Score: {score}")
+		draw(board, f"Score: {score}")
 		move = input("Move (WASD, Q=quit): ").strip().lower()
 		if move == "q":
 			break
@@ -69,11 +59,12 @@ def main() -> None:
 
 		nx = head_x + direction[0]
 		ny = head_y + direction[1]
-		if board[ny][nx] == "#" or (nx, ny) in snake:
+		if base[ny * stride + nx] == ord("#") or (nx, ny) in body:
 			print("Game over!")
 			break
 
 		snake.append((nx, ny))
+		body.add((nx, ny))
 		if (nx, ny) == food:
 			score += 1
 			food = (
@@ -81,7 +72,7 @@ def main() -> None:
 				random.randint(1, height - 2),
 			)
 		else:
-			snake.pop(0)
+			body.discard(snake.popleft())
 
 
 if __name__ == "__main__":
@@ -3,19 +3,20 @@
 from __future__ import annotations
 
 import random
-from itertools import product
 
 
 SUITS = ["♠", "♥", "♦", "♣"]
 RANKS = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
+RANK_INDEX = {rank: index for index, rank in enumerate(RANKS)}
+RED_SUITS = frozenset(("♥", "♦"))
 
 
 def rank_index(rank: str) -> int:
-	return RANKS.index(rank)
+	return RANK_INDEX[rank]
 
 
 def is_red(suit: str) -> bool:
-	return suit in {"♥", "♦"}
+	return suit in RED_SUITS
 
 
 def main() -> None:
@@ -25,8 +26,8 @@ def main() -> None:
 	foundations = {suit: [] for suit in SUITS}
 	tableau = [[] for _ in range(4)]
 
-	for i, _ in product(range(4), range(2)):
-		tableau[i].append(deck.pop())
+	for pile in tableau:
+		pile.extend((deck.pop(), deck.pop()))
 
 	while True:
 		print("\nFoundations:")
@@ -5,11 +5,79 @@ from __future__ import annotations
 import argparse
 import os
 import random
+import sys
 import time
+from typing import Iterator
 
+try:
+	import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+	np = None
 
-def clear() -> None:
-	os.system("cls" if os.name == "nt" else "clear")
+
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+
+
+def blank_frame(width: int, height: int) -> bytearray:
+	return bytearray("\n".join([" " * width] * height), "ascii")
+
+
+def star_frames(width: int, height: int, count: int) -> Iterator[bytearray]:
+	stars = [
+		(
+			random.uniform(0, width),
+			random.uniform(0, height),
+			random.uniform(0.4, 1.0),
+		)
+		for _ in range(count)
+	]
+	xs = [star[0] for star in stars]
+	ys = [star[1] for star in stars]
+	zs = [star[2] for star in stars]
+	stride = width + 1
+	blank = blank_frame(width, height)
+
+	while True:
+		buffer = blank[:]
+		for i in range(count):
+			x = int(xs[i])
+			y = int(ys[i])
+			if 0 <= x < width and 0 <= y < height:
+				buffer[y * stride + x] = ord(".") if zs[i] < 0.6 else ord("*")
+			xs[i] += zs[i] * 0.8
+			if xs[i] >= width:
+				xs[i] = 0
+				ys[i] = random.uniform(0, height)
+				zs[i] = random.uniform(0.4, 1.0)
+		yield buffer
+
+
+def star_frames_vectorized(
+	width: int, height: int, count: int, seed: int | None
+) -> Iterator[bytes]:
+	rng = np.random.default_rng(seed)
+	xs = rng.uniform(0, width, count)
+	ys = rng.uniform(0, height, count)
+	zs = rng.uniform(0.4, 1.0, count)
+	stride = width + 1
+	blank = np.frombuffer(blank_frame(width, height), dtype=np.uint8)
+
+	while True:
+		buffer = blank.copy()
+		ix = xs.astype(int)
+		iy = ys.astype(int)
+		valid = (0 <= ix) & (ix < width) & (0 <= iy) & (iy < height)
+		buffer[iy[valid] * stride + ix[valid]] = np.where(
+			zs[valid] < 0.6, ord("."), ord("*")
+		)
+		xs += zs * 0.8
+		wrapped = xs >= width
+		reset = int(wrapped.sum())
+		if reset:
+			xs[wrapped] = 0
+			ys[wrapped] = rng.uniform(0, height, reset)
+			zs[wrapped] = rng.uniform(0.4, 1.0, reset)
+		yield buffer.tobytes()
 
 
 def main() -> None:
@@ -21,34 +89,21 @@ def main() -> None:
 	parser.add_argument("--seed", type=int, default=None)
 	args = parser.parse_args()
 
-	if args.seed is not None:
-		random.seed(args.seed)
-
 	width = max(20, args.width)
 	height = max(8, args.height)
-	stars = [
-		{
-			"x": random.uniform(0, width),
-			"y": random.uniform(0, height),
-			"z": random.uniform(0.4, 1.0),
-		}
-		for _ in range(int(width * height * 0.06))
-	]
+	count = int(width * height * 0.06)
+	if np is not None:
+		frames = star_frames_vectorized(width, height, count, args.seed)
+	else:
+		if args.seed is not None:
+			random.seed(args.seed)
+		frames = star_frames(width, height, count)
 
-	for _ in range(max(1, args.frames)):
-		buffer = [[" " for _ in range(width)] for _ in range(height)]
-		for star in stars:
-			x = int(star["x"])
-			y = int(star["y"])
-			if 0 <= x < width and 0 <= y < height:
-				buffer[y][x] = "." if star["z"] < 0.6 else "*"
-			star["x"] += star["z"] * 0.8
-			if star["x"] >= width:
-				star["x"] = 0
-				star["y"] = random.uniform(0, height)
-				star["z"] = random.uniform(0.4, 1.0)
-		clear()
-		print("\n".join("".join(row) for row in buffer))
+	if os.name == "nt":
+		os.system("")  # switches the Windows console to VT escape handling
+	for _, buffer in zip(range(max(1, args.frames)), frames):
+		sys.stdout.write(f"{CLEAR_SCREEN}{buffer.decode()}\n")
+		sys.stdout.flush()
 		time.sleep(max(0.01, args.speed))
 
 